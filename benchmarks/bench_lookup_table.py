@@ -0,0 +1,64 @@
+"""
+Benchmark the lookup-table inference engine against the sklearn pipeline.
+
+Run from the repo root:
+
+    python -m benchmarks.bench_lookup_table --model artifacts/model-v1.0.0.joblib
+"""
+
+import argparse
+import timeit
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.datasets import load_iris
+
+from src.serve.api_utils.lookup_table import LookupTableClassifier
+
+
+def time_per_call(fn, repeats: int) -> float:
+    """Return the best average time (seconds) of a call over 5 runs."""
+    return min(timeit.repeat(fn, number=repeats, repeat=5)) / repeats
+
+
+def run(model_path: str, repeats: int):
+    """Compare per-request and batch prediction latency of both engines."""
+    pipeline = joblib.load(model_path)
+    lut = LookupTableClassifier.from_pipeline(pipeline)
+
+    X = load_iris(as_frame=True).data
+    single = X.iloc[[0]].to_numpy().tolist()
+    batch = X.sample(1000, replace=True, random_state=0).to_numpy()
+    np.testing.assert_array_equal(
+        lut.predict(batch),
+        pipeline.predict(pd.DataFrame(batch, columns=X.columns)),
+    )
+
+    cases = {
+        "single row": (
+            lambda: pipeline.predict(pd.DataFrame(single, columns=X.columns)),
+            lambda: lut.predict(single),
+        ),
+        "batch of 1000": (
+            lambda: pipeline.predict(pd.DataFrame(batch, columns=X.columns)),
+            lambda: lut.predict(batch),
+        ),
+    }
+
+    print(f"{'case':<16}{'sklearn (us)':>14}{'lookup (us)':>14}{'speedup':>10}")
+    for name, (sklearn_fn, lut_fn) in cases.items():
+        sklearn_s = time_per_call(sklearn_fn, repeats)
+        lut_s = time_per_call(lut_fn, repeats)
+        print(
+            f"{name:<16}{sklearn_s * 1e6:>14.1f}{lut_s * 1e6:>14.1f}"
+            f"{sklearn_s / lut_s:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model", default="artifacts/model-v1.0.0.joblib")
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+    run(args.model, args.repeats)
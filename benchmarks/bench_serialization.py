@@ -0,0 +1,62 @@
+"""
+Benchmark the serialization cost of a prediction response.
+
+Compares the default FastAPI path (building an ``IrisResponse`` and rendering
+it through ``jsonable_encoder`` and ``JSONResponse``) with the precomputed
+fragments of ``ResponseEncoder``.
+
+Run from the repo root:
+
+    python -m benchmarks.bench_serialization
+"""
+
+import argparse
+import timeit
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.serve.api_utils.fast_response import ResponseEncoder, json_response
+from src.serve.api_utils.schemas import IrisResponse
+
+SPECIES = ["setosa", "versicolor", "virginica"]
+MODEL_VERSION = "1.0.0"
+API_VERSION = "1.0.0"
+
+
+def default_response(prediction: int, request_id: str) -> bytes:
+    """Serialize a response the way FastAPI does for a ``response_model``."""
+    response = IrisResponse(
+        prediction=prediction,
+        prediction_label=SPECIES[prediction],
+        request_id=request_id,
+        model_version=MODEL_VERSION,
+        api_version=API_VERSION,
+    )
+    return JSONResponse(content=jsonable_encoder(response)).body
+
+
+def run(repeats: int):
+    """Compare the time per response of both serialization paths."""
+    encoder = ResponseEncoder(SPECIES, API_VERSION)
+    request_id = "3f2b8c1e-6a4d-4f0e-9b7a-2d5c8e1f0a9b"
+
+    def fast_response(prediction: int, request_id: str) -> bytes:
+        return json_response(encoder.encode(prediction, request_id, MODEL_VERSION)).body
+
+    assert default_response(1, request_id) == fast_response(1, request_id)
+
+    print(f"{'path':<12}{'per response (us)':>20}")
+    timings = {}
+    for name, fn in (("default", default_response), ("fragments", fast_response)):
+        total = min(timeit.repeat(lambda: fn(1, request_id), number=repeats, repeat=5))
+        timings[name] = total / repeats
+        print(f"{name:<12}{timings[name] * 1e6:>20.2f}")
+    print(f"speedup: {timings['default'] / timings['fragments']:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=20000)
+    args = parser.parse_args()
+    run(args.repeats)
@@ -0,0 +1,90 @@
+"""
+Soak test of the API memory footprint.
+
+Sends a fixed number of prediction requests to the app in-process and checks
+that the RSS stays within the budgets of the ``memory`` config section.
+
+Run from the repo root:
+
+    python -m benchmarks.soak_memory --requests 20000
+"""
+
+import argparse
+import gc
+import random
+
+from fastapi.testclient import TestClient
+
+from src.serve.api_utils.memory import current_rss_bytes
+from src.serve.app import app, config
+
+MB = 1024**2
+
+
+def make_payload(i: int) -> dict:
+    """Return a random prediction request."""
+    return {
+        "request_id": f"soak-{i}",
+        "sepal_length": random.uniform(4.0, 8.0),
+        "sepal_width": random.uniform(2.0, 4.5),
+        "petal_length": random.uniform(1.0, 7.0),
+        "petal_width": random.uniform(0.1, 2.5),
+    }
+
+
+def send(client: TestClient, n: int, offset: int = 0):
+    """Send ``n`` prediction requests."""
+    for i in range(offset, offset + n):
+        response = client.post("/predict", json=make_payload(i))
+        response.raise_for_status()
+
+
+def rss_after_gc() -> int:
+    """Return the RSS after a full garbage collection."""
+    gc.collect()
+    return current_rss_bytes()
+
+
+def run(n_requests: int, warmup: int, checkpoints: int) -> bool:
+    """Run the soak test and return whether the memory budgets are met."""
+    random.seed(0)
+    with TestClient(app) as client:
+        send(client, warmup)
+        baseline = rss_after_gc()
+        print(f"RSS after {warmup} warmup requests: {baseline / MB:.1f} MB")
+
+        rss = baseline
+        step = max(1, n_requests // checkpoints)
+        sent = 0
+        while sent < n_requests:
+            batch = min(step, n_requests - sent)
+            send(client, batch, offset=warmup + sent)
+            sent += batch
+            rss = rss_after_gc()
+            print(
+                f"RSS after {sent} requests: {rss / MB:.1f} MB "
+                f"({(rss - baseline) / MB:+.1f} MB)"
+            )
+
+    growth_mb = (rss - baseline) / MB
+    ok = (
+        rss / MB <= config.memory.rss_budget_mb
+        and growth_mb <= config.memory.rss_growth_budget_mb
+    )
+    print(
+        f"Final RSS {rss / MB:.1f} MB (budget {config.memory.rss_budget_mb} MB), "
+        f"growth {growth_mb:+.1f} MB "
+        f"(budget {config.memory.rss_growth_budget_mb} MB): "
+        f"{'OK' if ok else 'OVER BUDGET'}"
+    )
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--warmup", type=int, default=1000)
+    parser.add_argument("--checkpoints", type=int, default=10)
+    args = parser.parse_args()
+    if not run(args.requests, args.warmup, args.checkpoints):
+        raise SystemExit(1)
@@ -0,0 +1,26 @@
+"""Run the training workflows of a directory of configs in parallel."""
+
+import argparse
+
+from src.training.parallel_runner import run_workflows
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--config-dir", required=True, help="Directory of configs")
+    parser.add_argument("--cpu-budget", type=int, default=None, help="CPUs to use")
+    parser.add_argument(
+        "--threads-per-workflow", type=int, default=1, help="Threads per workflow"
+    )
+    parser.add_argument(
+        "--summary", default="artifacts/training_summary.json", help="Summary path"
+    )
+    args = parser.parse_args()
+
+    summary = run_workflows(
+        args.config_dir,
+        cpu_budget=args.cpu_budget,
+        threads_per_workflow=args.threads_per_workflow,
+        summary_path=args.summary,
+    )
+    if summary["failed"]:
+        raise SystemExit(1)
@@ -0,0 +1,236 @@
+"""
+Async client for the Iris Inference Service.
+It keeps a pool of keep-alive connections, coalesces concurrent single
+predictions into batch calls, and retries transient failures with backoff.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import httpx
+from loguru import logger
+
+from src.serve.api_utils.schemas import (
+    IrisBatchRequest,
+    IrisBatchResponse,
+    IrisRequest,
+    IrisResponse,
+)
+
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+class LatencyStats:
+    """Client-side latency statistics over a sliding window of calls."""
+
+    def __init__(self, window: int = 10000):
+        """Initialize empty statistics keeping the last ``window`` latencies."""
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.requests = 0
+        self.batches = 0
+        self.retries = 0
+        self.errors = 0
+
+    def record(self, latency: float, batch_size: int):
+        """Record a successful batch call."""
+        self.latencies.append(latency)
+        self.batches += 1
+        self.requests += batch_size
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Return the ``q``-th percentile (0-100) of the recorded latencies."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        idx = min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))
+        return ordered[idx]
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """Return a summary of the collected statistics."""
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "retries": self.retries,
+            "errors": self.errors,
+            "p50_s": self.percentile(50),
+            "p90_s": self.percentile(90),
+            "p99_s": self.percentile(99),
+        }
+
+
+class IrisClient:
+    """
+    Async client for the Iris Inference Service.
+
+    Calls to ``predict`` made concurrently are collected for up to
+    ``max_batch_delay_s`` (or until ``max_batch_size`` are pending) and sent as
+    a single ``/predict/batch`` request over a pooled keep-alive connection.
+
+    Example:
+    -------
+        async with IrisClient("http://localhost:5000") as client:
+            response = await client.predict(request)
+
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        max_batch_size: int = 32,
+        max_batch_delay_s: float = 0.005,
+        max_retries: int = 3,
+        backoff_s: float = 0.1,
+        timeout_s: float = 5.0,
+        max_connections: int = 10,
+        headers: Optional[Dict[str, str]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """Initialize the client and its connection pool."""
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay_s = max_batch_delay_s
+        self.max_retries = max_retries
+        self.backoff_s = backoff_s
+        self.timeout_s = timeout_s
+        self.stats = LatencyStats()
+        self._http = httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout_s,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            transport=transport,
+        )
+        self._pending: List[Tuple[IrisRequest, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+
+    async def __aenter__(self):
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """Flush pending calls and close the connection pool."""
+        await self.aclose()
+
+    async def aclose(self):
+        """Flush pending calls and close the connection pool."""
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self._http.aclose()
+
+    async def predict(self, request: IrisRequest) -> IrisResponse:
+        """
+        Predict a single flower, transparently batched with concurrent calls.
+
+        Args:
+        ----
+            request (IrisRequest): The flower measurements.
+
+        Returns:
+        -------
+        IrisResponse: The prediction result.
+
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((request, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self.max_batch_delay_s, self._flush
+            )
+        return await future
+
+    async def predict_batch(self, requests: List[IrisRequest]) -> List[IrisResponse]:
+        """
+        Predict a list of flowers, split into batches of ``max_batch_size``.
+
+        Args:
+        ----
+            requests (List[IrisRequest]): The flower measurements.
+
+        Returns:
+        -------
+        List[IrisResponse]: The prediction results, in the order of the requests.
+
+        """
+        chunks = [
+            requests[i : i + self.max_batch_size]
+            for i in range(0, len(requests), self.max_batch_size)
+        ]
+        results = await asyncio.gather(*[self._send_batch(c) for c in chunks])
+        return [response for chunk in results for response in chunk]
+
+    def _flush(self):
+        """Send all pending single predictions as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._dispatch(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, pending: List[Tuple[IrisRequest, asyncio.Future]]):
+        """Send a batch and resolve the futures of its callers."""
+        try:
+            responses = await self._send_batch([request for request, _ in pending])
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), response in zip(pending, responses):
+            if not future.done():
+                future.set_result(response)
+
+    async def _send_batch(self, requests: List[IrisRequest]) -> List[IrisResponse]:
+        """Send one batch request, retrying transient failures with backoff."""
+        payload = IrisBatchRequest(requests=requests).model_dump()
+        start = time.perf_counter()
+        attempt = 0
+        while True:
+            delay = self.backoff_s * 2**attempt
+            try:
+                r = await self._http.post("/predict/batch", json=payload)
+            except httpx.TransportError as e:
+                if attempt == self.max_retries:
+                    self.stats.errors += 1
+                    raise
+                logger.warning(f"Batch request failed ({e!r}), retrying")
+            else:
+                if r.status_code not in RETRYABLE_STATUS_CODES:
+                    if r.is_error:
+                        self.stats.errors += 1
+                    r.raise_for_status()
+                    responses = IrisBatchResponse.model_validate(r.json()).responses
+                    if len(responses) != len(requests):
+                        self.stats.errors += 1
+                        raise ValueError(
+                            f"Expected {len(requests)} responses, got {len(responses)}"
+                        )
+                    self.stats.record(time.perf_counter() - start, len(requests))
+                    return responses
+                if attempt == self.max_retries:
+                    self.stats.errors += 1
+                    r.raise_for_status()
+                delay = max(delay, _retry_after(r))
+                logger.warning(f"Batch request got {r.status_code}, retrying")
+            self.stats.retries += 1
+            attempt += 1
+            await asyncio.sleep(delay)
+
+
+def _retry_after(response: httpx.Response) -> float:
+    """Return the Retry-After delay of a response in seconds, or 0."""
+    try:
+        return float(response.headers.get("retry-after", 0))
+    except ValueError:
+        return 0.0
@@ -0,0 +1,168 @@
+"""Module for request admission control (concurrency limits and deadlines)."""
+
+import asyncio
+import json
+import time
+from typing import Optional
+
+from loguru import logger
+from prometheus_client import Counter, Gauge, Histogram
+
+from src.serve.api_utils.config import AdmissionConfig
+
+INFLIGHT_REQUESTS = Gauge(
+    "admission_inflight_requests",
+    "Number of admitted requests currently being processed.",
+)
+QUEUED_REQUESTS = Gauge(
+    "admission_queued_requests",
+    "Number of requests waiting for a concurrency slot.",
+)
+QUEUE_TIME = Histogram(
+    "admission_queue_time_seconds",
+    "Time spent waiting for a concurrency slot.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+REJECTED_REQUESTS = Counter(
+    "admission_rejected_requests_total",
+    "Number of requests rejected by admission control.",
+    ["reason"],
+)
+
+
+class AdmissionControlMiddleware:
+    """
+    ASGI middleware bounding in-flight work and per-request time.
+
+    Requests to the configured paths are admitted while fewer than
+    ``max_concurrent`` are being processed. Up to ``max_queue`` further requests
+    wait for a slot; beyond that they are rejected immediately with 429. A
+    request that cannot get a slot before its queue timeout (or deadline) is
+    rejected with 503, and one that exceeds its deadline while being processed
+    gets a 504, but keeps its slot until its processing actually finishes.
+    Rejections carry a ``Retry-After`` header.
+
+    The deadline is ``request_timeout_s``, shortened by the client-provided
+    deadline header (milliseconds) when present.
+    """
+
+    def __init__(self, app, config: AdmissionConfig):
+        """Initialize the middleware with the wrapped app and its config."""
+        self.app = app
+        self.config = config
+        self.paths = frozenset(config.paths)
+        self._semaphore = asyncio.Semaphore(config.max_concurrent)
+        self._queued = 0
+
+    async def __call__(self, scope, receive, send):
+        """Apply admission control to the configured HTTP paths."""
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        budget = self._request_budget(scope)
+
+        if self._semaphore.locked():
+            if self._queued >= self.config.max_queue:
+                REJECTED_REQUESTS.labels(reason="queue_full").inc()
+                logger.warning(f"Admission queue full, rejecting {scope['path']}")
+                await self._reject(send, 429, "Too many requests")
+                return
+            if not await self._wait_for_slot(min(self.config.queue_timeout_s, budget)):
+                REJECTED_REQUESTS.labels(reason="queue_timeout").inc()
+                logger.warning(f"Admission queue timeout, rejecting {scope['path']}")
+                await self._reject(send, 503, "Service overloaded")
+                return
+        else:
+            # A free slot is acquired without suspending
+            await self._semaphore.acquire()
+            QUEUE_TIME.observe(time.perf_counter() - start)
+
+        response_started = False
+        rejected = False
+
+        async def tracking_send(message):
+            nonlocal response_started
+            if rejected:
+                # The 504 was already sent, drop the late response
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        INFLIGHT_REQUESTS.inc()
+        # The slot is held until the request is done, not only until the
+        # deadline: cancelling the request would not stop work already running
+        # in a worker thread, which would then escape the concurrency limit
+        task = asyncio.ensure_future(self.app(scope, receive, tracking_send))
+        task.add_done_callback(self._release)
+        remaining = budget - (time.perf_counter() - start)
+        try:
+            await asyncio.wait_for(asyncio.shield(task), timeout=max(remaining, 0))
+        except asyncio.TimeoutError:
+            REJECTED_REQUESTS.labels(reason="deadline_exceeded").inc()
+            logger.warning(f"Request deadline exceeded for {scope['path']}")
+            if not response_started:
+                rejected = True
+                await self._reject(send, 504, "Request deadline exceeded")
+
+    def _release(self, task: asyncio.Task):
+        """Release the slot of a finished request."""
+        INFLIGHT_REQUESTS.dec()
+        self._semaphore.release()
+        if not task.cancelled() and task.exception() is not None:
+            # Retrieve the exception of requests finishing after their deadline
+            logger.opt(exception=task.exception()).debug("Admitted request failed")
+
+    async def _wait_for_slot(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for a concurrency slot."""
+        start = time.perf_counter()
+        self._queued += 1
+        QUEUED_REQUESTS.inc()
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._queued -= 1
+            QUEUED_REQUESTS.dec()
+            QUEUE_TIME.observe(time.perf_counter() - start)
+
+    def _request_budget(self, scope) -> float:
+        """Return the time budget (seconds) for a request."""
+        budget = self.config.request_timeout_s
+        client_deadline = self._client_deadline(scope)
+        if client_deadline is not None:
+            budget = min(budget, client_deadline)
+        return budget
+
+    def _client_deadline(self, scope) -> Optional[float]:
+        """Parse the client-provided deadline header, if any, into seconds."""
+        header = self.config.deadline_header.lower().encode("latin-1")
+        for name, value in scope.get("headers", []):
+            if name == header:
+                try:
+                    deadline_ms = float(value.decode("latin-1"))
+                except ValueError:
+                    logger.warning(f"Ignoring invalid deadline header: {value!r}")
+                    return None
+                return deadline_ms / 1000 if deadline_ms > 0 else None
+        return None
+
+    async def _reject(self, send, status_code: int, detail: str):
+        """Send a JSON error response with a Retry-After header."""
+        body = json.dumps({"detail": detail}).encode("utf-8")
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                    (b"retry-after", str(self.config.retry_after_s).encode("latin-1")),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -2,10 +2,10 @@
 
 import os
 from pathlib import Path
-from typing import List
+from typing import List, Literal, Optional
 
 import yaml
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class ModelConfig(BaseModel):
@@ -14,12 +14,43 @@ class ModelConfig(BaseModel):
     path: Path
     version: str
     species: List[str]
+    metadata_path: Optional[Path] = None
+    inference_engine: Literal["sklearn", "lookup_table"] = "sklearn"
 
 
 class ServerConfig(BaseModel):
     """Configuration for the FastAPI server."""
 
     host: str
+    max_batch_size: int = Field(256, gt=0)
+    fast_responses: bool = True
+
+
+class AdmissionConfig(BaseModel):
+    """Configuration for request admission control."""
+
+    max_concurrent: int = Field(32, gt=0)
+    max_queue: int = Field(64, ge=0)
+    queue_timeout_s: float = Field(1.0, gt=0)
+    request_timeout_s: float = Field(5.0, gt=0)
+    retry_after_s: int = Field(1, ge=0)
+    deadline_header: str = "X-Request-Timeout-Ms"
+    paths: List[str] = ["/predict", "/predict/batch"]
+
+
+class DriftConfig(BaseModel):
+    """Configuration for input and prediction drift monitoring."""
+
+    enabled: bool = True
+    window: int = Field(10000, gt=0)
+
+
+class MemoryConfig(BaseModel):
+    """Configuration for memory monitoring."""
+
+    admin_enabled: bool = False
+    rss_budget_mb: float = Field(512, gt=0)
+    rss_growth_budget_mb: float = Field(32, gt=0)
 
 
 class AppConfig(BaseModel):
@@ -28,6 +59,9 @@ class AppConfig(BaseModel):
     model: ModelConfig
     server: ServerConfig
     version: str
+    admission: AdmissionConfig = Field(default_factory=AdmissionConfig)
+    drift: DriftConfig = Field(default_factory=DriftConfig)
+    memory: MemoryConfig = Field(default_factory=MemoryConfig)
 
 
 def load_config() -> AppConfig:
@@ -0,0 +1,165 @@
+"""Module for monitoring drift of the live inputs and predictions."""
+
+import json
+import math
+import threading
+from bisect import bisect_right
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from loguru import logger
+from prometheus_client.core import GaugeMetricFamily
+
+# Floor for bin proportions, so that empty bins do not make the PSI infinite
+PSI_EPSILON = 1e-4
+
+
+def psi(expected: Sequence[float], actual: Sequence[float]) -> float:
+    """
+    Compute the population stability index between two distributions.
+
+    Args:
+    ----
+        expected (Sequence[float]): The reference bin proportions.
+        actual (Sequence[float]): The live bin proportions.
+
+    Returns:
+    -------
+    float: The PSI; values above ~0.2 usually indicate significant drift.
+
+    """
+    score = 0.0
+    for e, a in zip(expected, actual):
+        e, a = max(e, PSI_EPSILON), max(a, PSI_EPSILON)
+        score += (a - e) * math.log(a / e)
+    return score
+
+
+class DriftMonitor:
+    """
+    Constant-memory drift monitor for the live inputs and predictions.
+
+    Live feature values are counted in the reference quantile bins recorded at
+    training time, and predictions per class. Counts are halved whenever
+    ``window`` samples have been seen, so the sketches track recent traffic.
+    The PSI scores are only computed when Prometheus scrapes the metrics, i.e.
+    off the request path.
+    """
+
+    def __init__(self, reference: dict, species: List[str], window: int = 10000):
+        """Initialize the monitor from a reference distribution."""
+        self.species = species
+        self.window = window
+        self.features = list(reference["features"])
+        self.bin_edges = [reference["features"][f]["bin_edges"] for f in self.features]
+        self.expected = [reference["features"][f]["proportions"] for f in self.features]
+        self.expected_classes = [
+            reference["class_proportions"].get(str(i), 0.0) for i in range(len(species))
+        ]
+        self._feature_counts = [[0.0] * len(p) for p in self.expected]
+        self._class_counts = [0.0] * len(species)
+        self._seen = 0
+        self._total = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_metadata(
+        cls,
+        metadata_path: Optional[Path],
+        species: List[str],
+        model_version: str,
+        window: int = 10000,
+    ) -> Optional["DriftMonitor"]:
+        """
+        Create a monitor from the metadata file of the served model.
+
+        The metadata must belong to ``model_version`` and have a reference
+        distribution; otherwise drift monitoring is disabled.
+        """
+        if metadata_path is None or not Path(metadata_path).exists():
+            logger.warning("No model metadata found, drift monitoring is disabled")
+            return None
+        metadata = json.loads(Path(metadata_path).read_text())
+        if metadata.get("model_version") != model_version:
+            logger.warning(
+                f"Model metadata is for version {metadata.get('model_version')}, "
+                f"not the served version {model_version}, "
+                "drift monitoring is disabled"
+            )
+            return None
+        reference = metadata.get("reference_distribution")
+        if reference is None:
+            logger.warning(
+                "Model metadata has no reference distribution, "
+                "drift monitoring is disabled"
+            )
+            return None
+        return cls(reference, species, window)
+
+    def update(self, rows: Iterable[Sequence[float]], predictions: Iterable[int]):
+        """Add live feature rows and their predictions to the sketches."""
+        with self._lock:
+            for row, pred in zip(rows, predictions):
+                for counts, edges, value in zip(
+                    self._feature_counts, self.bin_edges, row
+                ):
+                    counts[bisect_right(edges, value)] += 1
+                self._class_counts[pred] += 1
+                self._total += 1
+                self._seen += 1
+                if self._seen >= self.window:
+                    self._decay()
+
+    def _decay(self):
+        """Halve all counts, so older traffic weighs less."""
+        for counts in self._feature_counts:
+            counts[:] = [c / 2 for c in counts]
+        self._class_counts = [c / 2 for c in self._class_counts]
+        self._total /= 2
+        self._seen = 0
+
+    def scores(self) -> Dict[str, float]:
+        """Return the PSI of every feature and of the predicted classes."""
+        with self._lock:
+            if not self._total:
+                return {}
+            result = {
+                feature: psi(expected, [c / self._total for c in counts])
+                for feature, expected, counts in zip(
+                    self.features, self.expected, self._feature_counts
+                )
+            }
+            result["prediction"] = psi(
+                self.expected_classes, [c / self._total for c in self._class_counts]
+            )
+            return result
+
+    def collect(self):
+        """Yield the drift metrics for the Prometheus registry."""
+        with self._lock:
+            class_counts = list(self._class_counts)
+            total = self._total
+
+        samples = GaugeMetricFamily(
+            "iris_drift_live_samples", "Weighted number of samples in the sketches."
+        )
+        samples.add_metric([], total)
+        yield samples
+
+        classes = GaugeMetricFamily(
+            "iris_drift_prediction_count",
+            "Weighted number of live predictions per class.",
+            labels=["label"],
+        )
+        for label, count in zip(self.species, class_counts):
+            classes.add_metric([label], count)
+        yield classes
+
+        scores = GaugeMetricFamily(
+            "iris_drift_psi",
+            "Population stability index of the live inputs and predictions.",
+            labels=["feature"],
+        )
+        for feature, score in self.scores().items():
+            scores.add_metric([feature], score)
+        yield scores
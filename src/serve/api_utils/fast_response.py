@@ -0,0 +1,77 @@
+"""Module for serializing prediction responses from precomputed fragments."""
+
+import json
+from typing import Dict, List, Sequence, Tuple
+
+from fastapi import Response
+
+from src.serve.api_utils.schemas import IrisResponse
+
+# Marker the request ID field is split on when building the fragments
+_REQUEST_ID_FIELD = b'"request_id":""'
+
+
+class ResponseEncoder:
+    """
+    Serialize ``IrisResponse`` payloads without building Pydantic models.
+
+    Only ``request_id`` varies between responses with the same prediction and
+    model version, so the JSON before and after it is rendered once through
+    ``IrisResponse`` (which also validates it) and cached. Encoding a response
+    then only escapes the request ID and concatenates bytes. The output is
+    byte-identical to ``IrisResponse.model_dump_json()``.
+    """
+
+    def __init__(self, species: List[str], api_version: str):
+        """Initialize the encoder for the given labels and API version."""
+        self.species = species
+        self.api_version = api_version
+        self._fragments: Dict[Tuple[int, str], Tuple[bytes, bytes]] = {}
+
+    def fragments(self, prediction: int, model_version: str) -> Tuple[bytes, bytes]:
+        """Return the cached JSON before and after the request ID value."""
+        key = (prediction, model_version)
+        fragments = self._fragments.get(key)
+        if fragments is None:
+            template = IrisResponse(
+                prediction=prediction,
+                prediction_label=self.species[prediction],
+                request_id="",
+                model_version=model_version,
+                api_version=self.api_version,
+            ).model_dump_json()
+            prefix, suffix = template.encode("utf-8").split(_REQUEST_ID_FIELD)
+            fragments = (prefix + b'"request_id":', suffix)
+            self._fragments[key] = fragments
+        return fragments
+
+    def encode(self, prediction: int, request_id: str, model_version: str) -> bytes:
+        """Serialize a single prediction response."""
+        prefix, suffix = self.fragments(prediction, model_version)
+        return prefix + _encode_str(request_id) + suffix
+
+    def encode_batch(
+        self,
+        predictions: Sequence[int],
+        request_ids: Sequence[str],
+        model_version: str,
+    ) -> bytes:
+        """Serialize an ``IrisBatchResponse`` payload."""
+        return (
+            b'{"responses":['
+            + b",".join(
+                self.encode(prediction, request_id, model_version)
+                for prediction, request_id in zip(predictions, request_ids)
+            )
+            + b"]}"
+        )
+
+
+def _encode_str(value: str) -> bytes:
+    """Encode a string as a JSON string, escaping like Pydantic does."""
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+def json_response(content: bytes) -> Response:
+    """Wrap already serialized JSON in a response."""
+    return Response(content=content, media_type="application/json")
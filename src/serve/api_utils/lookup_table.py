@@ -0,0 +1,198 @@
+"""
+Lookup-table inference engine for discretize-then-linear pipelines.
+Each one-hot encoded bin of a discretized feature adds a fixed column of
+weights to the logits, so these contributions are precomputed once and a
+prediction reduces to bin lookups plus a small dot product for the
+continuous features.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+from sklearn.compose import ColumnTransformer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import KBinsDiscretizer, MinMaxScaler, StandardScaler
+
+
+class LookupTableClassifier:
+    """
+    Drop-in replacement for the ``predict`` of a fitted sklearn pipeline.
+
+    Supported pipelines are a ``ColumnTransformer`` whose branches are either
+    a (optionally standard-scaled) one-hot ``KBinsDiscretizer`` or a
+    ``MinMaxScaler``/``StandardScaler``, followed by a ``LogisticRegression``.
+    """
+
+    def __init__(
+        self,
+        feature_names: List[str],
+        classes: np.ndarray,
+        intercept: np.ndarray,
+        linear_idx: np.ndarray,
+        linear_weights: np.ndarray,
+        binned: List[Tuple[int, float, float, np.ndarray, np.ndarray]],
+    ):
+        """
+        Initialize the engine from its precomputed tables.
+
+        Args:
+        ----
+            feature_names (List[str]): The input columns, in order.
+            classes (np.ndarray): The class labels.
+            intercept (np.ndarray): The logit offsets, of shape (n_classes,).
+            linear_idx (np.ndarray): The input indices of the continuous features.
+            linear_weights (np.ndarray): Their (scaler-folded) weights, of shape
+                (n_linear, n_classes).
+            binned (List[Tuple]): For each discretized feature, its input index,
+                scaler mean and scale, inner bin edges, and the per-bin logit
+                contributions of shape (n_bins, n_classes).
+
+        """
+        self.feature_names = feature_names
+        self.classes = classes
+        self.intercept = intercept
+        self.linear_idx = linear_idx
+        self.linear_weights = linear_weights
+        self.binned = binned
+
+    @classmethod
+    def from_pipeline(cls, pipeline: Pipeline) -> "LookupTableClassifier":
+        """
+        Precompute the lookup tables of a fitted pipeline.
+
+        Args:
+        ----
+            pipeline (Pipeline): The fitted preprocessing and model pipeline.
+
+        Returns:
+        -------
+        LookupTableClassifier: The equivalent lookup-table engine.
+
+        Raises:
+        ------
+            ValueError: If the pipeline structure is not supported.
+
+        """
+        if len(pipeline.steps) != 2:
+            raise ValueError("Expected a (preprocessor, model) pipeline")
+        preprocessor, model = pipeline.steps[0][1], pipeline.steps[1][1]
+        if not isinstance(preprocessor, ColumnTransformer):
+            raise ValueError("Preprocessor must be a ColumnTransformer")
+        if not isinstance(model, LogisticRegression):
+            raise ValueError("Model must be a LogisticRegression")
+
+        feature_names = list(preprocessor.feature_names_in_)
+        # (n_outputs, n_classes); the binary case has a single logit
+        weights = model.coef_.T
+        intercept = model.intercept_.astype(np.float64).copy()
+
+        linear_idx: List[int] = []
+        linear_weights: List[np.ndarray] = []
+        binned = []
+        offset = 0
+        for name, transformer, columns in preprocessor.transformers_:
+            if transformer == "drop" or len(columns) == 0:
+                continue
+            if transformer == "passthrough":
+                raise ValueError(f"Unsupported passthrough branch: {name}")
+
+            input_idx = [feature_names.index(c) for c in columns]
+            scaler, discretizer = _split_branch(name, transformer)
+
+            if discretizer is not None:
+                mean, scale = _standard_params(scaler, len(columns))
+                for j, idx in enumerate(input_idx):
+                    n_bins = int(discretizer.n_bins_[j])
+                    binned.append(
+                        (
+                            idx,
+                            float(mean[j]),
+                            float(scale[j]),
+                            discretizer.bin_edges_[j][1:-1],
+                            weights[offset : offset + n_bins],
+                        )
+                    )
+                    offset += n_bins
+            else:
+                # Fold the affine scaler into the weights and the intercept
+                mult, add = _affine_params(scaler)
+                for j, idx in enumerate(input_idx):
+                    linear_idx.append(idx)
+                    linear_weights.append(weights[offset] * mult[j])
+                    intercept += weights[offset] * add[j]
+                    offset += 1
+
+        if offset != weights.shape[0]:
+            raise ValueError("Preprocessor outputs do not match the model inputs")
+
+        n_logits = weights.shape[1]
+        return cls(
+            feature_names=feature_names,
+            classes=model.classes_,
+            intercept=intercept,
+            linear_idx=np.array(linear_idx, dtype=int),
+            linear_weights=np.array(linear_weights).reshape(-1, n_logits),
+            binned=binned,
+        )
+
+    def decision_function(self, X) -> np.ndarray:
+        """Return the logits of the samples in ``X``."""
+        X = np.asarray(X, dtype=np.float64)
+        if not np.isfinite(X).all():
+            # The sklearn pipeline rejects these too, rather than binning them
+            raise ValueError("Input X contains infinity or NaN")
+        logits = X[:, self.linear_idx] @ self.linear_weights + self.intercept
+        for idx, mean, scale, edges, table in self.binned:
+            bins = np.searchsorted(edges, (X[:, idx] - mean) / scale, side="right")
+            logits += table[bins]
+        return logits
+
+    def predict(self, X) -> np.ndarray:
+        """Predict the class of the samples in ``X``."""
+        logits = self.decision_function(X)
+        if logits.shape[1] == 1:
+            return self.classes[(logits[:, 0] > 0).astype(int)]
+        return self.classes[logits.argmax(axis=1)]
+
+
+def _split_branch(name, transformer):
+    """Split a branch into its scaler and (optional) discretizer."""
+    steps = (
+        [step for _, step in transformer.steps]
+        if isinstance(transformer, Pipeline)
+        else [transformer]
+    )
+    if isinstance(steps[-1], KBinsDiscretizer):
+        discretizer = steps[-1]
+        if not discretizer.encode.startswith("onehot"):
+            raise ValueError(f"Discretizer of branch {name} must be one-hot encoded")
+        scalers = steps[:-1]
+        if len(scalers) > 1 or not all(isinstance(s, StandardScaler) for s in scalers):
+            raise ValueError(f"Unsupported scaling before discretizing: {name}")
+        return (scalers[0] if scalers else None), discretizer
+    if len(steps) == 1 and isinstance(steps[0], (MinMaxScaler, StandardScaler)):
+        if isinstance(steps[0], MinMaxScaler) and steps[0].clip:
+            raise ValueError(f"Clipping MinMaxScaler is not supported: {name}")
+        return steps[0], None
+    raise ValueError(f"Unsupported branch: {name}")
+
+
+def _standard_params(scaler, n_features):
+    """Return the mean and scale a StandardScaler (or no scaler) applies."""
+    mean = np.zeros(n_features)
+    scale = np.ones(n_features)
+    if scaler is not None:
+        if scaler.mean_ is not None:
+            mean = scaler.mean_
+        if scaler.scale_ is not None:
+            scale = scaler.scale_
+    return mean, scale
+
+
+def _affine_params(scaler):
+    """Return ``(mult, add)`` such that the scaler computes ``x * mult + add``."""
+    if isinstance(scaler, MinMaxScaler):
+        return scaler.scale_, scaler.min_
+    mean, scale = _standard_params(scaler, scaler.n_features_in_)
+    return 1 / scale, -mean / scale
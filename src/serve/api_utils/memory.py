@@ -0,0 +1,218 @@
+"""Module for memory footprint metrics and allocation tracking."""
+
+import gc
+import resource
+import sys
+import tracemalloc
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from loguru import logger
+from prometheus_client.core import GaugeMetricFamily
+
+from src.serve.api_utils.authentication import dummy_authenticator
+
+# Filters the allocations of the tracing machinery out of snapshots
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+)
+
+# The tracemalloc endpoints are plain functions, so that FastAPI runs them in
+# the threadpool: snapshots of a traced process can take long enough to stall
+# the event loop, and all predictions with it
+router = APIRouter(prefix="/admin/memory")
+
+# Snapshot taken when tracing starts, the reference for later snapshots
+_baseline: Optional[tracemalloc.Snapshot] = None
+
+
+def current_rss_bytes() -> int:
+    """Return the current resident set size of the process in bytes."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        # No procfs (e.g. macOS), fall back to the peak RSS
+        return peak_rss_bytes()
+
+
+def peak_rss_bytes() -> int:
+    """Return the peak resident set size of the process in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class MemoryCollector:
+    """
+    Prometheus collector of the memory footprint and GC statistics.
+
+    It complements the default process and GC collectors of prometheus_client
+    (e.g. ``process_resident_memory_bytes``) rather than repeating them. The
+    values are read when the metrics are scraped, so they are fresh even on an
+    idle server and cost nothing on the request path.
+    """
+
+    def __init__(self, rss_budget_bytes: int):
+        """Initialize the collector with the configured RSS budget."""
+        self.rss_budget_bytes = rss_budget_bytes
+
+    def collect(self):
+        """Yield the memory metrics for the Prometheus registry."""
+        for name, documentation, value in (
+            ("memory_peak_rss_bytes", "Peak resident set size.", peak_rss_bytes()),
+            (
+                "memory_rss_budget_bytes",
+                "Configured RSS budget.",
+                self.rss_budget_bytes,
+            ),
+            (
+                "memory_traced_bytes",
+                "Memory traced by tracemalloc (0 when not tracing).",
+                tracemalloc.get_traced_memory()[0],
+            ),
+        ):
+            gauge = GaugeMetricFamily(name, documentation)
+            gauge.add_metric([], value)
+            yield gauge
+
+        pending = GaugeMetricFamily(
+            "memory_gc_pending_objects",
+            "Allocations since the last collection of each GC generation.",
+            labels=["generation"],
+        )
+        for generation, count in enumerate(gc.get_count()):
+            pending.add_metric([str(generation)], count)
+        yield pending
+
+
+def _check_token(verified_token: bool, endpoint: str):
+    """Raise if the token verification failed."""
+    if not verified_token:
+        logger.warning(f"Unauthorized access to {endpoint} endpoint")
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+
+
+@router.get("/stats", summary="Memory Statistics")
+async def memory_stats(verified_token: bool = Depends(dummy_authenticator)):
+    """
+    Return the current memory footprint and GC statistics.
+
+    Args:
+    ----
+        verified_token (bool): Token verification status.
+
+    Returns:
+    -------
+        dict: RSS, peak RSS, GC and tracemalloc statistics.
+
+    """
+    _check_token(verified_token, "/admin/memory/stats")
+    current, peak = tracemalloc.get_traced_memory()
+    return {
+        "rss_bytes": current_rss_bytes(),
+        "peak_rss_bytes": peak_rss_bytes(),
+        "gc_count": list(gc.get_count()),
+        "gc_stats": gc.get_stats(),
+        "tracing": tracemalloc.is_tracing(),
+        "traced_bytes": current,
+        "traced_peak_bytes": peak,
+    }
+
+
+@router.post("/tracing/start", summary="Start Allocation Tracking")
+def start_tracing(
+    frames: int = Query(1, ge=1, le=64),
+    verified_token: bool = Depends(dummy_authenticator),
+):
+    """
+    Start tracking allocations with tracemalloc and take a baseline snapshot.
+
+    Args:
+    ----
+        frames (int): Number of stack frames recorded per allocation.
+        verified_token (bool): Token verification status.
+
+    Returns:
+    -------
+        dict: Tracing status message.
+
+    """
+    global _baseline
+    _check_token(verified_token, "/admin/memory/tracing/start")
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+    _baseline = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+    logger.info("Allocation tracking started")
+    return {"status": "ok", "message": "Allocation tracking started."}
+
+
+@router.post("/tracing/stop", summary="Stop Allocation Tracking")
+def stop_tracing(verified_token: bool = Depends(dummy_authenticator)):
+    """
+    Stop tracking allocations and drop the baseline snapshot.
+
+    Args:
+    ----
+        verified_token (bool): Token verification status.
+
+    Returns:
+    -------
+        dict: Tracing status message.
+
+    """
+    global _baseline
+    _check_token(verified_token, "/admin/memory/tracing/stop")
+    tracemalloc.stop()
+    _baseline = None
+    logger.info("Allocation tracking stopped")
+    return {"status": "ok", "message": "Allocation tracking stopped."}
+
+
+@router.get("/snapshot", summary="Allocation Snapshot")
+def snapshot(
+    limit: int = Query(10, ge=1, le=100),
+    verified_token: bool = Depends(dummy_authenticator),
+):
+    """
+    Return the top allocation sites, and their growth since tracing started.
+
+    Args:
+    ----
+        limit (int): Number of allocation sites to return.
+        verified_token (bool): Token verification status.
+
+    Returns:
+    -------
+        dict: The traced memory and the top allocation sites by growth.
+
+    Raises:
+    ------
+        HTTPException: If the token verification fails or tracing is off.
+
+    """
+    _check_token(verified_token, "/admin/memory/snapshot")
+    if not tracemalloc.is_tracing() or _baseline is None:
+        raise HTTPException(
+            status.HTTP_409_CONFLICT, detail="Allocation tracking is not started"
+        )
+
+    current = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+    stats = current.compare_to(_baseline, "lineno")[:limit]
+    traced, traced_peak = tracemalloc.get_traced_memory()
+    return {
+        "traced_bytes": traced,
+        "traced_peak_bytes": traced_peak,
+        "top_allocations": [
+            {
+                "location": str(stat.traceback),
+                "size_bytes": stat.size,
+                "size_diff_bytes": stat.size_diff,
+                "count": stat.count,
+                "count_diff": stat.count_diff,
+            }
+            for stat in stats
+        ],
+    }
@@ -3,7 +3,7 @@ This module contains the schemas for the API requests and responses.
 It defines the request and response models using Pydantic.
 """
 
-from typing import Literal
+from typing import List, Literal
 
 from pydantic import BaseModel, Field
 
@@ -26,3 +26,15 @@ class IrisResponse(BaseModel):
     request_id: str
     model_version: str
     api_version: str
+
+
+class IrisBatchRequest(BaseModel):
+    """Request model for predicting a batch of Iris flowers."""
+
+    requests: List[IrisRequest] = Field(..., min_length=1)
+
+
+class IrisBatchResponse(BaseModel):
+    """Response model for a batch of Iris species predictions."""
+
+    responses: List[IrisResponse]
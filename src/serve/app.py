@@ -1,18 +1,38 @@
 """A FastAPI application for serving a machine learning model."""
 
 import os
+from typing import List
 
 import joblib
 import pandas as pd
 import uvicorn
 from fastapi import Depends, FastAPI, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from loguru import logger
+from prometheus_client import REGISTRY
 from prometheus_fastapi_instrumentator import Instrumentator
 
+from src.serve.api_utils.admission import AdmissionControlMiddleware
 from src.serve.api_utils.authentication import dummy_authenticator
 from src.serve.api_utils.base_app import router as health_router
 from src.serve.api_utils.config import load_config
-from src.serve.api_utils.schemas import IrisRequest, IrisResponse
+from src.serve.api_utils.drift import DriftMonitor
+from src.serve.api_utils.fast_response import ResponseEncoder, json_response
+from src.serve.api_utils.lookup_table import LookupTableClassifier
+from src.serve.api_utils.memory import MemoryCollector, router as memory_router
+from src.serve.api_utils.schemas import (
+    IrisBatchRequest,
+    IrisBatchResponse,
+    IrisRequest,
+    IrisResponse,
+)
+
+FEATURE_COLUMNS = [
+    "sepal length (cm)",
+    "sepal width (cm)",
+    "petal length (cm)",
+    "petal width (cm)",
+]
 
 # Load configuration
 config = load_config()
@@ -21,6 +41,25 @@ FASTAPI_PORT = int(os.getenv("FASTAPI_PORT", "5000"))
 logger.info(f"Loading model from {config.model.path}")
 model = joblib.load(config.model.path)
 
+if config.model.inference_engine == "lookup_table":
+    logger.info("Precomputing lookup tables for inference")
+    model = LookupTableClassifier.from_pipeline(model)
+    if model.feature_names != FEATURE_COLUMNS:
+        raise ValueError(f"Model expects columns {model.feature_names}")
+
+drift_monitor = None
+if config.drift.enabled:
+    drift_monitor = DriftMonitor.from_metadata(
+        config.model.metadata_path,
+        config.model.species,
+        config.model.version,
+        config.drift.window,
+    )
+    if drift_monitor is not None:
+        REGISTRY.register(drift_monitor)
+
+response_encoder = ResponseEncoder(config.model.species, config.version)
+
 
 app = FastAPI(
     title="Iris Inference Service",
@@ -28,11 +67,67 @@ app = FastAPI(
     description="Predict Iris species based on flower measurements.",
 )
 
-Instrumentator().instrument(app).expose(app)
+# Added before the Instrumentator so that rejected requests are still measured
+app.add_middleware(AdmissionControlMiddleware, config=config.admission)
+
+# Untemplated paths are ignored so that unknown URLs do not grow the labels
+Instrumentator(should_ignore_untemplated=True).instrument(app).expose(app)
 
 # Include the health check router
 app.include_router(health_router)
 
+REGISTRY.register(
+    MemoryCollector(rss_budget_bytes=int(config.memory.rss_budget_mb * 1024**2))
+)
+
+if config.memory.admin_enabled:
+    app.include_router(memory_router)
+
+
+def predict_indices(items: List[IrisRequest]) -> List[int]:
+    """
+    Run the model on a list of requests.
+
+    Args:
+    ----
+        items (List[IrisRequest]): The requests containing flower measurements.
+
+    Returns:
+    -------
+    List[int]: The predicted class index for each request.
+
+    """
+    rows = [
+        [
+            item.sepal_length,
+            item.sepal_width,
+            item.petal_length,
+            item.petal_width,
+        ]
+        for item in items
+    ]
+    if config.model.inference_engine == "lookup_table":
+        # Rows are already in the column order the lookup tables expect
+        features = rows
+    else:
+        features = pd.DataFrame(rows, columns=FEATURE_COLUMNS)
+    pred_indices = [int(pred) for pred in model.predict(features)]
+
+    if drift_monitor is not None:
+        drift_monitor.update(rows, pred_indices)
+    return pred_indices
+
+
+def build_response(item: IrisRequest, pred_idx: int) -> IrisResponse:
+    """Build the response for a single prediction."""
+    return IrisResponse(
+        prediction=pred_idx,
+        prediction_label=config.model.species[pred_idx],
+        request_id=item.request_id,
+        model_version=config.model.version,
+        api_version=config.version,
+    )
+
 
 @app.post("/predict", response_model=IrisResponse, summary="Predict Iris Species")
 async def predict(
@@ -61,35 +156,18 @@ async def predict(
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
 
     try:
-        features = pd.DataFrame(
-            [
-                [
-                    data.sepal_length,
-                    data.sepal_width,
-                    data.petal_length,
-                    data.petal_width,
-                ]
-            ],
-            columns=[
-                "sepal length (cm)",
-                "sepal width (cm)",
-                "petal length (cm)",
-                "petal width (cm)",
-            ],
-        )
-        pred_idx = int(model.predict(features)[0])
-
-        response = IrisResponse(
-            prediction=pred_idx,
-            prediction_label=config.model.species[pred_idx],
-            request_id=request_id,
-            model_version=config.model.version,
-            api_version=config.version,
-        )
+        # Run the model off the event loop so that deadlines can be enforced
+        pred_idx = (await run_in_threadpool(predict_indices, [data]))[0]
+        if config.server.fast_responses:
+            response = json_response(
+                response_encoder.encode(pred_idx, request_id, config.model.version)
+            )
+        else:
+            response = build_response(data, pred_idx)
 
         logger.info(
             "Prediction successful. Request ID: "
-            f"{request_id} Prediction: {response.prediction_label}"
+            f"{request_id} Prediction: {config.model.species[pred_idx]}"
         )
         return response
 
@@ -100,6 +178,68 @@ async def predict(
         ) from e
 
 
+@app.post(
+    "/predict/batch",
+    response_model=IrisBatchResponse,
+    summary="Predict Iris Species for a Batch",
+)
+async def predict_batch(
+    request: Request,
+    data: IrisBatchRequest,
+    verified_token: bool = Depends(dummy_authenticator),
+):
+    """
+    Predict the species of a batch of Iris flowers in one model call.
+
+    Args:
+    ----
+        request (Request): The HTTP request object.
+        data (IrisBatchRequest): The request body containing the flowers.
+        verified_token (bool): The result of the authentication check.
+
+    Returns:
+    -------
+    IrisBatchResponse: The prediction results, in the order of the requests.
+
+    """
+    request_ids = [item.request_id for item in data.requests]
+
+    if not verified_token:
+        logger.warning(f"Unauthorized access attempt. Request IDs: {request_ids}")
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+
+    if len(data.requests) > config.server.max_batch_size:
+        raise HTTPException(
+            status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch size exceeds {config.server.max_batch_size}",
+        )
+
+    try:
+        pred_indices = await run_in_threadpool(predict_indices, data.requests)
+        if config.server.fast_responses:
+            response = json_response(
+                response_encoder.encode_batch(
+                    pred_indices, request_ids, config.model.version
+                )
+            )
+        else:
+            response = IrisBatchResponse(
+                responses=[
+                    build_response(item, pred_idx)
+                    for item, pred_idx in zip(data.requests, pred_indices)
+                ]
+            )
+
+        logger.info(f"Batch prediction successful. Batch size: {len(pred_indices)}")
+        return response
+
+    except Exception as e:
+        logger.exception(f"Batch prediction failed. Request IDs: {request_ids}")
+        raise HTTPException(
+            status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Prediction failed: {str(e)}"
+        ) from e
+
+
 if __name__ == "__main__":
     uvicorn.run(
         app,
@@ -0,0 +1,203 @@
+"""Run many registered training workflows concurrently on a local process pool."""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+from threadpoolctl import threadpool_limits
+
+from src.training.workflow_classes.registry import get_workflow_class
+
+# Steps of a workflow, in the order TrainingWorkflow runs them
+WORKFLOW_STEPS = (
+    "load_data",
+    "split_data",
+    "build_pipeline",
+    "train_model",
+    "save_model",
+)
+
+
+def find_configs(config_dir: str) -> List[Path]:
+    """
+    Find the workflow config files in a directory.
+
+    Parameters
+    ----------
+    config_dir: str
+        The directory containing the YAML configs.
+
+    Returns
+    -------
+    List[Path]:
+        The config paths, sorted by name.
+
+    """
+    config_dir = Path(config_dir)
+    if not config_dir.is_dir():
+        raise FileNotFoundError(f"Config directory not found at: {config_dir}")
+    return sorted(p for p in config_dir.iterdir() if p.suffix in (".yaml", ".yml"))
+
+
+def _init_worker(threads_per_workflow: int):
+    """Limit the native thread pools of a worker to its share of the CPU budget."""
+    for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[var] = str(threads_per_workflow)
+    threadpool_limits(limits=threads_per_workflow)
+
+
+def run_workflow(config_path: str) -> Dict[str, Any]:
+    """
+    Run all steps of the workflow configured in ``config_path``.
+
+    Parameters
+    ----------
+    config_path: str
+        Path to the YAML config of the workflow.
+
+    Returns
+    -------
+    Dict[str, Any]:
+        The workflow summary: status, step timings and metrics.
+
+    """
+    result: Dict[str, Any] = {"config": str(config_path), "timings": {}}
+    start = time.perf_counter()
+    try:
+        with open(config_path, "r") as f:
+            config = yaml.safe_load(f)
+        result["workflow_class"] = config.get("workflow_class")
+
+        workflow = get_workflow_class(config.get("workflow_class"))(config)
+        for step in WORKFLOW_STEPS:
+            step_start = time.perf_counter()
+            getattr(workflow, step)()
+            result["timings"][step] = time.perf_counter() - step_start
+
+        result["status"] = "succeeded"
+        result["model_version"] = config.get("model_version")
+        result["accuracy"] = getattr(workflow, "accuracy", None)
+    except Exception as e:
+        result["status"] = "failed"
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["total_s"] = time.perf_counter() - start
+    return result
+
+
+def _read_output_dir(config_path: Path) -> Optional[str]:
+    """Return the output directory of a config, raising if it is unreadable."""
+    with open(config_path, "r") as f:
+        config = yaml.safe_load(f)
+    if not isinstance(config, dict):
+        raise ValueError(f"Config is not a mapping: {config_path}")
+    return config.get("output_dir")
+
+
+def _check_configs(config_paths: List[Path]) -> Tuple[List[Path], List[Dict[str, Any]]]:
+    """
+    Split the configs into runnable ones and failed results for unreadable ones.
+
+    Raises if two readable configs write to the same output directory.
+    """
+    runnable: List[Path] = []
+    failed: List[Dict[str, Any]] = []
+    seen: Dict[str, Path] = {}
+    for path in config_paths:
+        try:
+            output_dir = _read_output_dir(path)
+        except Exception as e:
+            failed.append(
+                {
+                    "config": str(path),
+                    "timings": {},
+                    "status": "failed",
+                    "error": f"{type(e).__name__}: {e}",
+                    "total_s": 0.0,
+                }
+            )
+            continue
+        runnable.append(path)
+        if output_dir is None:
+            continue
+        key = str(Path(output_dir).resolve())
+        if key in seen:
+            raise ValueError(
+                f"Configs {seen[key]} and {path} share output_dir {output_dir}"
+            )
+        seen[key] = path
+    return runnable, failed
+
+
+def run_workflows(
+    config_dir: str,
+    cpu_budget: Optional[int] = None,
+    threads_per_workflow: int = 1,
+    summary_path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Run the workflows of all configs in a directory concurrently.
+
+    Parameters
+    ----------
+    config_dir: str
+        The directory containing the YAML configs.
+    cpu_budget: Optional[int]
+        The number of CPUs to use in total. Defaults to all available CPUs.
+    threads_per_workflow: int
+        The number of native threads each workflow may use.
+    summary_path: Optional[str]
+        Where to write the consolidated JSON summary, if given.
+
+    Returns
+    -------
+    Dict[str, Any]:
+        The consolidated summary of timings and metrics.
+
+    """
+    config_paths = find_configs(config_dir)
+    if not config_paths:
+        raise ValueError(f"No configs found in: {config_dir}")
+    config_paths, results = _check_configs(config_paths)
+    for result in results:
+        print(f"{result['config']}: {result['status']} ({result['error']})")
+
+    cpu_budget = cpu_budget or os.cpu_count() or 1
+    max_workers = max(1, min(len(config_paths), cpu_budget // threads_per_workflow))
+
+    started_at = datetime.utcnow().isoformat(timespec="seconds") + "Z"
+    start = time.perf_counter()
+    if config_paths:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(threads_per_workflow,),
+        ) as executor:
+            futures = [executor.submit(run_workflow, str(p)) for p in config_paths]
+            for future in as_completed(futures):
+                result = future.result()
+                print(
+                    f"{result['config']}: {result['status']} "
+                    f"in {result['total_s']:.2f}s"
+                )
+        results += [future.result() for future in futures]
+    results.sort(key=lambda r: r["config"])
+
+    summary = {
+        "started_at": started_at,
+        "wall_time_s": time.perf_counter() - start,
+        "cpu_budget": cpu_budget,
+        "max_workers": max_workers,
+        "succeeded": sum(r["status"] == "succeeded" for r in results),
+        "failed": sum(r["status"] == "failed" for r in results),
+        "workflows": results,
+    }
+    if summary_path:
+        Path(summary_path).parent.mkdir(parents=True, exist_ok=True)
+        Path(summary_path).write_text(json.dumps(summary, indent=2))
+        print(f"Summary saved at {summary_path}")
+    return summary
@@ -4,10 +4,13 @@ This module implements a workflow for training a classifier on the Iris dataset.
 """
 
 import json
+import re
 from datetime import datetime
 from pathlib import Path
+from typing import Optional, Tuple
 
 import joblib
+import numpy as np
 import sklearn
 from sklearn.compose import ColumnTransformer
 from sklearn.datasets import load_iris
@@ -19,6 +22,21 @@ from sklearn.preprocessing import KBinsDiscretizer, MinMaxScaler, StandardScaler
 from src.training.workflow_classes.registry import register_workflow
 from src.training.workflow_classes.workflow_tempalate import WorkflowTemplate
 
+# Config keys the fitted preprocessing depends on
+PREPROCESSING_KEYS = ("sepal_bins", "petal_scaler_range")
+
+
+def bump_version(version: str) -> str:
+    """Increment the last component of a dotted version string."""
+    if not re.fullmatch(r"\d+(\.\d+)*", str(version)):
+        raise ValueError(
+            f"Cannot bump model version {version!r}: expected dotted integers "
+            "such as 1.0.0"
+        )
+    parts = str(version).split(".")
+    parts[-1] = str(int(parts[-1]) + 1)
+    return ".".join(parts)
+
 
 @register_workflow
 class IrisClassifier(WorkflowTemplate):
@@ -83,11 +101,118 @@ class IrisClassifier(WorkflowTemplate):
             ]
         )
 
+        self.warm_started_from = None
+        if self.config.get("incremental", False):
+            self._prepare_incremental()
+
+    def _prepare_incremental(self):
+        """
+        Warm-start from the previous artifact in ``output_dir``, if possible.
+
+        The previous pipeline (including its fitted preprocessing) is reused when
+        it was trained with the same preprocessing config and sklearn version;
+        otherwise the freshly built pipeline is trained from scratch. In both
+        cases the model version is bumped from the previous one.
+        """
+        previous = self._load_previous_artifact()
+        if previous is None:
+            print("No previous artifact found, training from scratch.")
+            return
+
+        pipeline, metadata = previous
+        self.config["model_version"] = bump_version(metadata["model_version"])
+
+        if not self._preprocessing_reusable(metadata):
+            print(
+                f"Preprocessing of model v{metadata['model_version']} is not "
+                "reusable, training from scratch."
+            )
+            return
+
+        pipeline.named_steps["model"].set_params(
+            warm_start=True, max_iter=self.config["logreg_max_iter"]
+        )
+        self.pipeline = pipeline
+        self.warm_started_from = metadata["model_version"]
+
+    def _load_previous_artifact(self) -> Optional[Tuple[Pipeline, dict]]:
+        """Load the last saved pipeline and its metadata from ``output_dir``."""
+        out_dir = Path(self.config["output_dir"])
+        metadata_path = out_dir / "metadata.json"
+        if not metadata_path.exists():
+            return None
+
+        metadata = json.loads(metadata_path.read_text())
+        model_path = out_dir / f"model-v{metadata['model_version']}.joblib"
+        if not model_path.exists():
+            return None
+
+        return joblib.load(model_path), metadata
+
+    def _preprocessing_reusable(self, metadata: dict) -> bool:
+        """Check whether the previous fitted preprocessing is still valid."""
+        if metadata.get("sklearn_version") != sklearn.__version__:
+            return False
+        previous_config = metadata.get("config", {})
+        return all(
+            previous_config.get(key) == self.config.get(key)
+            for key in PREPROCESSING_KEYS
+        )
+
+    def _training_data(self):
+        """
+        Return the features and targets the estimator is trained on.
+
+        With ``incremental_data: "new"``, a warm-started estimator is only
+        trained on ``X_new`` and ``y_new``. This is a hook for subclasses whose
+        ``load_data`` sets them; ``IrisClassifier`` has no source of new data.
+        """
+        if self.warm_started_from and self.config.get("incremental_data") == "new":
+            if not hasattr(self, "X_new"):
+                raise ValueError(
+                    "incremental_data='new' requires load_data to set X_new and y_new"
+                )
+            return self.X_new, self.y_new
+        return self.X_train, self.y_train
+
     def train_model(self):
         """Train the model."""
-        self.pipeline.fit(self.X_train, self.y_train)
+        X, y = self._training_data()
+        if self.warm_started_from:
+            # Keep the fitted preprocessing and only warm-start the estimator
+            features = self.pipeline.named_steps["preprocessor"].transform(X)
+            self.pipeline.named_steps["model"].fit(features, y)
+        else:
+            self.pipeline.fit(X, y)
         self.accuracy = self.pipeline.score(self.X_test, self.y_test)
 
+    def reference_distribution(self) -> dict:
+        """
+        Summarize the training split for drift monitoring.
+
+        Each feature is described by its interior quantile bin edges and the
+        proportion of training samples falling in each bin, and the targets by
+        their class proportions.
+        """
+        n_bins = self.config.get("drift_bins", 10)
+        features = {}
+        for column in self.X_train.columns:
+            values = self.X_train[column].to_numpy()
+            edges = np.quantile(values, np.linspace(0, 1, n_bins + 1)[1:-1])
+            counts = np.bincount(
+                np.searchsorted(edges, values, side="right"), minlength=n_bins
+            )
+            features[column] = {
+                "bin_edges": edges.tolist(),
+                "proportions": (counts / counts.sum()).tolist(),
+            }
+
+        classes = self.y_train.value_counts(normalize=True).sort_index()
+        return {
+            "features": features,
+            "class_proportions": {str(k): float(v) for k, v in classes.items()},
+        }
+
     def save_model(self):
         """Save the trained model and metadata."""
         out_dir = Path(self.config["output_dir"])
@@ -101,6 +226,8 @@ class IrisClassifier(WorkflowTemplate):
             "accuracy": self.accuracy,
             "trained_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
             "sklearn_version": sklearn.__version__,
+            "warm_started_from": self.warm_started_from,
+            "reference_distribution": self.reference_distribution(),
             "config": self.config,
         }
         (out_dir / "metadata.json").write_text(json.dumps(metadata, indent=2))
@@ -0,0 +1,144 @@
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from src.client.iris_client import IrisClient
+from src.serve.app import app
+
+
+def make_request(i):
+    return {
+        "request_id": f"client-{i}",
+        "sepal_length": 5.1,
+        "sepal_width": 3.5,
+        "petal_length": 1.4,
+        "petal_width": 0.2,
+    }
+
+
+def make_client(transport, **kwargs):
+    return IrisClient("http://test", transport=transport, backoff_s=0.001, **kwargs)
+
+
+class TestIrisClient:
+
+    def test_concurrent_predictions_are_coalesced(self):
+        calls = []
+
+        def fake_predict(features):
+            calls.append(len(features))
+            return [0] * len(features)
+
+        async def run():
+            transport = httpx.ASGITransport(app=app)
+            async with make_client(transport, max_batch_delay_s=0.01) as client:
+                responses = await asyncio.gather(
+                    *[client.predict(make_request(i)) for i in range(10)]
+                )
+                return responses, client.stats.summary()
+
+        with patch("src.serve.app.model.predict", side_effect=fake_predict):
+            responses, stats = asyncio.run(run())
+
+        assert calls == [10]
+        assert [r.request_id for r in responses] == [f"client-{i}" for i in range(10)]
+        assert all(r.prediction_label == "setosa" for r in responses)
+        assert stats["batches"] == 1
+        assert stats["requests"] == 10
+        assert stats["p50_s"] is not None
+
+    def test_batch_is_flushed_when_full(self):
+        calls = []
+
+        def fake_predict(features):
+            calls.append(len(features))
+            return [1] * len(features)
+
+        async def run():
+            transport = httpx.ASGITransport(app=app)
+            async with make_client(
+                transport, max_batch_size=4, max_batch_delay_s=10
+            ) as client:
+                return await asyncio.gather(
+                    *[client.predict(make_request(i)) for i in range(8)]
+                )
+
+        with patch("src.serve.app.model.predict", side_effect=fake_predict):
+            responses = asyncio.run(run())
+
+        assert calls == [4, 4]
+        assert len(responses) == 8
+
+    def test_predict_batch_splits_and_keeps_order(self):
+        async def run():
+            transport = httpx.ASGITransport(app=app)
+            async with make_client(transport, max_batch_size=3) as client:
+                return await client.predict_batch([make_request(i) for i in range(7)])
+
+        with patch(
+            "src.serve.app.model.predict",
+            side_effect=lambda features: [2] * len(features),
+        ):
+            responses = asyncio.run(run())
+
+        assert [r.request_id for r in responses] == [f"client-{i}" for i in range(7)]
+        assert all(r.prediction == 2 for r in responses)
+
+    def test_retries_transient_failures(self):
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            if len(attempts) < 3:
+                return httpx.Response(503, headers={"Retry-After": "0"})
+            return httpx.Response(
+                200,
+                json={
+                    "responses": [
+                        {
+                            "prediction": 0,
+                            "prediction_label": "setosa",
+                            "request_id": "client-0",
+                            "model_version": "1.0.0",
+                            "api_version": "1.0.0",
+                        }
+                    ]
+                },
+            )
+
+        async def run():
+            async with make_client(httpx.MockTransport(handler)) as client:
+                response = await client.predict(make_request(0))
+                return response, client.stats.summary()
+
+        response, stats = asyncio.run(run())
+
+        assert response.request_id == "client-0"
+        assert len(attempts) == 3
+        assert stats["retries"] == 2
+        assert stats["errors"] == 0
+
+    def test_gives_up_after_max_retries(self):
+        async def run():
+            transport = httpx.MockTransport(lambda request: httpx.Response(429))
+            async with make_client(transport, max_retries=1) as client:
+                try:
+                    await client.predict(make_request(0))
+                finally:
+                    assert client.stats.errors == 1
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(run())
+
+    def test_mismatched_response_count_fails(self):
+        async def run():
+            transport = httpx.MockTransport(
+                lambda request: httpx.Response(200, json={"responses": []})
+            )
+            async with make_client(transport) as client:
+                return await asyncio.wait_for(client.predict(make_request(0)), 1)
+
+        with pytest.raises(ValueError, match="Expected 1 responses, got 0"):
+            asyncio.run(run())
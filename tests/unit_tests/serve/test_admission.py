@@ -0,0 +1,179 @@
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.serve.api_utils.admission import (
+    INFLIGHT_REQUESTS,
+    AdmissionControlMiddleware,
+)
+from src.serve.api_utils.config import AdmissionConfig
+from src.serve.app import app as serve_app, config as serve_config
+
+
+def build_app(delay, **overrides):
+    config = AdmissionConfig(**overrides)
+    app = FastAPI()
+    app.add_middleware(AdmissionControlMiddleware, config=config)
+
+    @app.post("/predict")
+    async def predict():
+        await asyncio.sleep(delay)
+        return {"status": "ok"}
+
+    @app.get("/health")
+    async def health():
+        await asyncio.sleep(delay)
+        return {"status": "ok"}
+
+    return app
+
+
+async def send_requests(app, n, path="/predict", headers=None):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        method = c.post if path == "/predict" else c.get
+        return await asyncio.gather(
+            *[method(path, headers=headers) for _ in range(n)]
+        )
+
+
+class TestAdmissionControl:
+
+    def test_requests_within_limits_are_admitted(self):
+        app = build_app(0.01, max_concurrent=2, max_queue=2)
+        responses = asyncio.run(send_requests(app, 4))
+        assert [r.status_code for r in responses] == [200] * 4
+
+    def test_queue_full_is_rejected_with_429(self):
+        app = build_app(0.2, max_concurrent=1, max_queue=1, retry_after_s=3)
+        responses = asyncio.run(send_requests(app, 3))
+        codes = sorted(r.status_code for r in responses)
+        assert codes == [200, 200, 429]
+        rejected = next(r for r in responses if r.status_code == 429)
+        assert rejected.headers["retry-after"] == "3"
+
+    def test_queue_timeout_is_rejected_with_503(self):
+        app = build_app(0.3, max_concurrent=1, max_queue=5, queue_timeout_s=0.05)
+        responses = asyncio.run(send_requests(app, 2))
+        codes = sorted(r.status_code for r in responses)
+        assert codes == [200, 503]
+        rejected = next(r for r in responses if r.status_code == 503)
+        assert "retry-after" in rejected.headers
+
+    def test_request_timeout_returns_504(self):
+        app = build_app(0.3, request_timeout_s=0.05)
+        responses = asyncio.run(send_requests(app, 1))
+        assert responses[0].status_code == 504
+        assert responses[0].json()["detail"] == "Request deadline exceeded"
+
+    @pytest.mark.parametrize(
+        "deadline_ms,expected_status", [("50", 504), ("5000", 200), ("bad", 200)]
+    )
+    def test_client_deadline_header(self, deadline_ms, expected_status):
+        app = build_app(0.2, request_timeout_s=1.0)
+        responses = asyncio.run(
+            send_requests(app, 1, headers={"X-Request-Timeout-Ms": deadline_ms})
+        )
+        assert responses[0].status_code == expected_status
+
+    def test_unlisted_paths_are_not_limited(self):
+        app = build_app(0.1, max_concurrent=1, max_queue=0, request_timeout_s=0.01)
+        responses = asyncio.run(send_requests(app, 3, path="/health"))
+        assert [r.status_code for r in responses] == [200] * 3
+
+    def test_blocking_prediction_exceeds_deadline(self):
+        test_data = {
+            "request_id": "deadline-test-uuid",
+            "sepal_length": 5.1,
+            "sepal_width": 3.5,
+            "petal_length": 1.4,
+            "petal_width": 0.2,
+        }
+
+        def blocking_predict(features):
+            time.sleep(0.5)
+            return [0]
+
+        async def run():
+            transport = httpx.ASGITransport(app=serve_app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as c:
+                return await asyncio.gather(
+                    *[
+                        c.post(
+                            "/predict",
+                            json=test_data,
+                            headers={"X-Request-Timeout-Ms": "100"},
+                        )
+                        for _ in range(3)
+                    ]
+                )
+
+        with patch("src.serve.app.model.predict", side_effect=blocking_predict):
+            start = time.perf_counter()
+            responses = asyncio.run(run())
+            elapsed = time.perf_counter() - start
+
+        assert [r.status_code for r in responses] == [504] * 3
+        assert elapsed < 0.5
+
+    def test_timed_out_predictions_keep_their_slot(self):
+        test_data = {
+            "request_id": "slot-test-uuid",
+            "sepal_length": 5.1,
+            "sepal_width": 3.5,
+            "petal_length": 1.4,
+            "petal_width": 0.2,
+        }
+        max_concurrent = serve_config.admission.max_concurrent
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def blocking_predict(features):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.3)
+            with lock:
+                running -= 1
+            return [0]
+
+        async def run():
+            transport = httpx.ASGITransport(app=serve_app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as c:
+                waves = []
+                for _ in range(2):
+                    waves.append(
+                        await asyncio.gather(
+                            *[
+                                c.post(
+                                    "/predict",
+                                    json=test_data,
+                                    headers={"X-Request-Timeout-Ms": "50"},
+                                )
+                                for _ in range(max_concurrent)
+                            ]
+                        )
+                    )
+                # Let the abandoned predictions finish and release their slots
+                while running or INFLIGHT_REQUESTS._value.get():
+                    await asyncio.sleep(0.01)
+                return waves
+
+        with patch("src.serve.app.model.predict", side_effect=blocking_predict):
+            first, second = asyncio.run(run())
+
+        assert [r.status_code for r in first] == [504] * max_concurrent
+        # The slots are still held by the running predictions
+        assert [r.status_code for r in second] == [503] * max_concurrent
+        assert peak <= max_concurrent
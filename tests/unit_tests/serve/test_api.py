@@ -1,10 +1,11 @@
 import pytest
 from fastapi.testclient import TestClient
+from loguru import logger
 from unittest.mock import patch
 
 from src.serve.api_utils.authentication import dummy_authenticator
 from src.serve.api_utils.config import load_config
-from src.serve.app import app
+from src.serve.app import app, config as app_config
 
 config = load_config()
 
@@ -88,3 +89,122 @@ class TestIrisApp:
 
         assert response.status_code == 500
         assert "Prediction failed" in response.json()["detail"]
+
+    def test_non_finite_prediction_failure(self):
+        body = (
+            '{"request_id": "inf-test-uuid", "sepal_length": 5.1, '
+            '"sepal_width": 3.5, "petal_length": 1e400, "petal_width": 0.2}'
+        )
+
+        response = client.post(
+            "/predict", content=body, headers={"Content-Type": "application/json"}
+        )
+
+        assert response.status_code == 500
+        assert "Prediction failed" in response.json()["detail"]
+
+    def test_successful_batch_prediction(self):
+        test_data = {
+            "requests": [
+                {
+                    "request_id": f"batch-uuid-{i}",
+                    "sepal_length": 5.1,
+                    "sepal_width": 3.5,
+                    "petal_length": 1.4,
+                    "petal_width": 0.2,
+                }
+                for i in range(3)
+            ]
+        }
+
+        with patch("src.serve.app.model.predict", return_value=[0, 1, 2]):
+            response = client.post("/predict/batch", json=test_data)
+
+        assert response.status_code == 200
+        body = response.json()["responses"]
+        assert [r["prediction"] for r in body] == [0, 1, 2]
+        assert [r["request_id"] for r in body] == [
+            "batch-uuid-0",
+            "batch-uuid-1",
+            "batch-uuid-2",
+        ]
+        assert body[2]["prediction_label"] == config.model.species[2]
+
+    def test_empty_batch_prediction(self):
+        response = client.post("/predict/batch", json={"requests": []})
+        assert response.status_code == 422
+
+    def test_drift_metrics_are_exposed(self):
+        test_data = {
+            "request_id": "drift-test-uuid",
+            "sepal_length": 5.1,
+            "sepal_width": 3.5,
+            "petal_length": 1.4,
+            "petal_width": 0.2,
+        }
+
+        with patch("src.serve.app.model.predict", return_value=[0]):
+            client.post("/predict", json=test_data)
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert 'iris_drift_psi{feature="petal width (cm)"}' in response.text
+
+    def test_prediction_with_configured_engine(self):
+        test_data = {
+            "request_id": "engine-test-uuid",
+            "sepal_length": 5.1,
+            "sepal_width": 3.5,
+            "petal_length": 1.4,
+            "petal_width": 0.2,
+        }
+
+        response = client.post("/predict", json=test_data)
+
+        assert response.status_code == 200
+        assert response.json()["prediction_label"] == "setosa"
+
+    @pytest.mark.parametrize("fast_responses", [True, False])
+    def test_response_paths_match(self, fast_responses):
+        test_data = {
+            "request_id": "path-test-uuid",
+            "sepal_length": 5.1,
+            "sepal_width": 3.5,
+            "petal_length": 1.4,
+            "petal_width": 0.2,
+        }
+
+        with patch("src.serve.app.model.predict", return_value=[1]), patch.object(
+            app_config.server, "fast_responses", fast_responses
+        ):
+            response = client.post("/predict", json=test_data)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {
+            "prediction": 1,
+            "prediction_label": "versicolor",
+            "request_id": "path-test-uuid",
+            "model_version": config.model.version,
+            "api_version": config.version,
+        }
+
+    def test_batch_serialization_failure_is_not_logged_as_success(self):
+        messages = []
+        sink_id = logger.add(messages.append, format="{message}")
+        body = (
+            '{"requests": [{"request_id": "\\ud800", "sepal_length": 5.1, '
+            '"sepal_width": 3.5, "petal_length": 1.4, "petal_width": 0.2}]}'
+        )
+
+        with patch("src.serve.app.model.predict", return_value=[0]):
+            response = client.post(
+                "/predict/batch",
+                content=body,
+                headers={"Content-Type": "application/json"},
+            )
+        logger.remove(sink_id)
+
+        assert response.status_code == 500
+        assert not any("Batch prediction successful" in m for m in messages)
+        assert any("Batch prediction failed" in m for m in messages)
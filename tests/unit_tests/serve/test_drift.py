@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from src.serve.api_utils.drift import DriftMonitor, psi
+
+SPECIES = ["setosa", "versicolor", "virginica"]
+
+
+@pytest.fixture
+def reference():
+    return {
+        "features": {
+            "x": {"bin_edges": [1.0, 2.0, 3.0], "proportions": [0.25] * 4},
+        },
+        "class_proportions": {"0": 0.5, "1": 0.25, "2": 0.25},
+    }
+
+
+class TestDriftMonitor:
+
+    def test_psi(self):
+        assert psi([0.5, 0.5], [0.5, 0.5]) == 0
+        assert psi([0.5, 0.5], [0.9, 0.1]) > 0.2
+        assert psi([0.5, 0.5], [1.0, 0.0]) < float("inf")
+
+    def test_in_distribution_has_low_psi(self, reference):
+        monitor = DriftMonitor(reference, SPECIES)
+        monitor.update([[0.5], [1.5], [2.5], [3.5]] * 10, [0, 0, 1, 2] * 10)
+
+        scores = monitor.scores()
+
+        assert scores["x"] == pytest.approx(0)
+        assert scores["prediction"] == pytest.approx(0)
+
+    def test_shifted_inputs_have_high_psi(self, reference):
+        monitor = DriftMonitor(reference, SPECIES)
+        monitor.update([[5.0]] * 40, [2] * 40)
+
+        scores = monitor.scores()
+
+        assert scores["x"] > 0.2
+        assert scores["prediction"] > 0.2
+
+    def test_counts_are_bounded_by_window(self, reference):
+        monitor = DriftMonitor(reference, SPECIES, window=10)
+        monitor.update([[0.5]] * 1000, [0] * 1000)
+
+        assert monitor._total < 20
+
+    def test_no_samples(self, reference):
+        monitor = DriftMonitor(reference, SPECIES)
+        assert monitor.scores() == {}
+
+    def test_collect(self, reference):
+        monitor = DriftMonitor(reference, SPECIES)
+        monitor.update([[0.5]], [1])
+
+        metrics = {m.name: m for m in monitor.collect()}
+
+        assert set(metrics) == {
+            "iris_drift_live_samples",
+            "iris_drift_prediction_count",
+            "iris_drift_psi",
+        }
+        labels = {s.labels["feature"] for s in metrics["iris_drift_psi"].samples}
+        assert labels == {"x", "prediction"}
+
+    def test_from_metadata(self, tmp_path, reference):
+        path = tmp_path / "metadata.json"
+        path.write_text(json.dumps({"model_version": "1.0"}))
+        assert DriftMonitor.from_metadata(path, SPECIES, "1.0") is None
+
+        path.write_text(
+            json.dumps({"model_version": "1.0", "reference_distribution": reference})
+        )
+        assert DriftMonitor.from_metadata(path, SPECIES, "1.0") is not None
+
+        missing = tmp_path / "missing.json"
+        assert DriftMonitor.from_metadata(missing, SPECIES, "1.0") is None
+
+    def test_from_metadata_of_other_model_version(self, tmp_path, reference):
+        path = tmp_path / "metadata.json"
+        path.write_text(
+            json.dumps({"model_version": "1.0.1", "reference_distribution": reference})
+        )
+
+        assert DriftMonitor.from_metadata(path, SPECIES, "1.0.0") is None
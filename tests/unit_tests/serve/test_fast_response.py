@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+from src.serve.api_utils.fast_response import ResponseEncoder
+from src.serve.api_utils.schemas import IrisBatchResponse, IrisResponse
+
+SPECIES = ["setosa", "versicolor", "virginica"]
+
+
+@pytest.fixture
+def encoder():
+    return ResponseEncoder(SPECIES, api_version="1.0.0")
+
+
+class TestResponseEncoder:
+
+    @pytest.mark.parametrize(
+        "request_id",
+        ["test-uuid", "", "é ü 中 😀", 'quote " backslash \\ newline \n', "\x01\x1f"],
+    )
+    @pytest.mark.parametrize("prediction", [0, 1, 2])
+    def test_matches_pydantic(self, encoder, prediction, request_id):
+        expected = IrisResponse(
+            prediction=prediction,
+            prediction_label=SPECIES[prediction],
+            request_id=request_id,
+            model_version="2.1.0",
+            api_version="1.0.0",
+        ).model_dump_json()
+
+        encoded = encoder.encode(prediction, request_id, "2.1.0")
+
+        assert encoded == expected.encode("utf-8")
+        assert json.loads(encoded)["request_id"] == request_id
+
+    def test_fragments_are_cached(self, encoder):
+        first = encoder.fragments(1, "1.0.0")
+        assert encoder.fragments(1, "1.0.0") is first
+        assert encoder.fragments(1, "1.0.1") is not first
+
+    def test_encode_batch(self, encoder):
+        encoded = encoder.encode_batch([0, 2], ["a", "b"], "1.0.0")
+
+        batch = IrisBatchResponse.model_validate_json(encoded)
+
+        assert [r.prediction_label for r in batch.responses] == ["setosa", "virginica"]
+        assert [r.request_id for r in batch.responses] == ["a", "b"]
+
+    def test_invalid_prediction(self, encoder):
+        with pytest.raises(IndexError):
+            encoder.encode(3, "test-uuid", "1.0.0")
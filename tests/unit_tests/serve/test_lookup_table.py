@@ -0,0 +1,91 @@
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.datasets import load_iris
+from sklearn.preprocessing import MinMaxScaler
+
+from src.serve.api_utils.config import load_config
+from src.serve.api_utils.lookup_table import LookupTableClassifier
+from src.training.workflow_classes.iris_classifier import IrisClassifier
+
+config = load_config()
+
+
+def trained_pipeline(**overrides):
+    workflow = IrisClassifier(
+        {
+            "sepal_bins": 3,
+            "petal_scaler_range": [0, 1],
+            "logreg_max_iter": 100,
+            **overrides,
+        }
+    )
+    workflow.load_data()
+    workflow.split_data()
+    workflow.build_pipeline()
+    workflow.train_model()
+    return workflow.pipeline
+
+
+@pytest.fixture
+def samples():
+    X = load_iris(as_frame=True).data
+    rng = np.random.default_rng(0)
+    random = pd.DataFrame(rng.uniform(0, 8, (2000, 4)), columns=X.columns)
+    return pd.concat([X, random], ignore_index=True)
+
+
+class TestLookupTableClassifier:
+
+    def test_parity_with_shipped_model(self, samples):
+        pipeline = joblib.load(config.model.path)
+        lut = LookupTableClassifier.from_pipeline(pipeline)
+
+        np.testing.assert_array_equal(
+            lut.predict(samples.to_numpy()), pipeline.predict(samples)
+        )
+        np.testing.assert_allclose(
+            lut.decision_function(samples.to_numpy()),
+            pipeline.decision_function(samples),
+            atol=1e-9,
+        )
+
+    @pytest.mark.parametrize(
+        "overrides", [{"sepal_bins": 5}, {"petal_scaler_range": [-1, 2]}]
+    )
+    def test_parity_with_other_configs(self, samples, overrides):
+        pipeline = trained_pipeline(**overrides)
+        lut = LookupTableClassifier.from_pipeline(pipeline)
+
+        np.testing.assert_array_equal(
+            lut.predict(samples.to_numpy()), pipeline.predict(samples)
+        )
+
+    def test_single_row_list(self):
+        pipeline = joblib.load(config.model.path)
+        lut = LookupTableClassifier.from_pipeline(pipeline)
+
+        assert lut.predict([[5.1, 3.5, 1.4, 0.2]])[0] == 0
+
+    @pytest.mark.parametrize("value", [np.inf, 1e400, np.nan])
+    def test_non_finite_input_is_rejected(self, value):
+        pipeline = joblib.load(config.model.path)
+        lut = LookupTableClassifier.from_pipeline(pipeline)
+        row = pd.DataFrame([[5.1, 3.5, value, 0.2]], columns=pipeline.feature_names_in_)
+
+        with pytest.raises(ValueError):
+            pipeline.predict(row)
+        with pytest.raises(ValueError, match="infinity or NaN"):
+            lut.predict(row.to_numpy())
+
+    def test_unsupported_pipeline(self):
+        pipeline = trained_pipeline()
+        pipeline.steps[0][1].transformers_[1] = (
+            "petal_branch",
+            MinMaxScaler(clip=True).fit(np.zeros((2, 2))),
+            ["petal length (cm)", "petal width (cm)"],
+        )
+
+        with pytest.raises(ValueError):
+            LookupTableClassifier.from_pipeline(pipeline)
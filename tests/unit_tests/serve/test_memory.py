@@ -0,0 +1,105 @@
+import asyncio
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from src.serve.api_utils.authentication import dummy_authenticator
+from src.serve.api_utils.memory import (
+    MemoryCollector,
+    current_rss_bytes,
+    peak_rss_bytes,
+    router,
+)
+
+app = FastAPI()
+app.include_router(router)
+client = TestClient(app)
+
+
+class TestMemory:
+
+    @pytest.fixture(autouse=True)
+    def stop_tracing(self):
+        yield
+        client.post("/admin/memory/tracing/stop")
+
+    def test_rss(self):
+        assert current_rss_bytes() > 0
+        assert peak_rss_bytes() > 0
+
+    def test_memory_collector(self):
+        metrics = {m.name: m for m in MemoryCollector(rss_budget_bytes=1024).collect()}
+
+        assert metrics["memory_rss_budget_bytes"].samples[0].value == 1024
+        assert metrics["memory_peak_rss_bytes"].samples[0].value > 0
+        # Already exported by the default collectors of prometheus_client
+        assert "memory_rss_bytes" not in metrics
+        assert "memory_gc_uncollectable_objects" not in metrics
+        pending = metrics["memory_gc_pending_objects"].samples
+        assert [s.labels["generation"] for s in pending] == ["0", "1", "2"]
+
+    def test_memory_metrics_are_registered_without_requests(self):
+        import src.serve.app  # noqa: F401
+
+        assert REGISTRY.get_sample_value("memory_peak_rss_bytes") > 0
+        assert REGISTRY.get_sample_value("memory_rss_budget_bytes") > 0
+
+    def test_stats(self):
+        response = client.get("/admin/memory/stats")
+        assert response.status_code == 200
+        body = response.json()
+        assert body["rss_bytes"] > 0
+        assert len(body["gc_count"]) == 3
+        assert body["tracing"] is False
+
+    def test_snapshot_requires_tracing(self):
+        response = client.get("/admin/memory/snapshot")
+        assert response.status_code == 409
+
+    def test_tracing_snapshot(self):
+        assert client.post("/admin/memory/tracing/start").status_code == 200
+        assert tracemalloc.is_tracing()
+
+        leak = [bytearray(1024) for _ in range(1000)]
+        response = client.get("/admin/memory/snapshot", params={"limit": 5})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["traced_bytes"] > 0
+        assert len(body["top_allocations"]) <= 5
+        assert body["top_allocations"][0]["size_diff_bytes"] >= 1024 * 1000
+        assert "test_memory.py" in body["top_allocations"][0]["location"]
+        del leak
+
+        assert client.post("/admin/memory/tracing/stop").status_code == 200
+        assert not tracemalloc.is_tracing()
+
+    def test_authentication_failure(self):
+        app.dependency_overrides[dummy_authenticator] = lambda: False
+
+        response = client.get("/admin/memory/stats")
+
+        app.dependency_overrides = {}
+
+        assert response.status_code == 401
+
+    def test_snapshots_are_taken_off_the_event_loop(self):
+        take_snapshot = tracemalloc.take_snapshot
+        loops = []
+
+        def recording_take_snapshot():
+            try:
+                loops.append(asyncio.get_running_loop())
+            except RuntimeError:
+                loops.append(None)
+            return take_snapshot()
+
+        with patch("tracemalloc.take_snapshot", side_effect=recording_take_snapshot):
+            assert client.post("/admin/memory/tracing/start").status_code == 200
+            assert client.get("/admin/memory/snapshot").status_code == 200
+
+        assert loops == [None, None]
@@ -0,0 +1,104 @@
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+
+from src.training.parallel_runner import find_configs, run_workflow, run_workflows
+
+
+def write_config(config_dir, name, output_dir, **overrides):
+    config = {
+        "workflow_class": "IrisClassifier",
+        "model_version": "1.0",
+        "output_dir": str(output_dir),
+        "sepal_bins": 3,
+        "petal_scaler_range": [0, 1],
+        "logreg_max_iter": 100,
+    }
+    config.update(overrides)
+    path = Path(config_dir) / name
+    path.write_text(yaml.safe_dump(config))
+    return path
+
+
+class TestParallelRunner:
+
+    def test_find_configs(self, tmp_path):
+        write_config(tmp_path, "b.yaml", tmp_path / "b")
+        write_config(tmp_path, "a.yml", tmp_path / "a")
+        (tmp_path / "notes.txt").write_text("not a config")
+
+        assert [p.name for p in find_configs(tmp_path)] == ["a.yml", "b.yaml"]
+
+    def test_run_workflow(self, tmp_path):
+        path = write_config(tmp_path, "iris.yaml", tmp_path / "out")
+
+        result = run_workflow(str(path))
+
+        assert result["status"] == "succeeded"
+        assert result["accuracy"] > 0.5
+        assert set(result["timings"]) == {
+            "load_data",
+            "split_data",
+            "build_pipeline",
+            "train_model",
+            "save_model",
+        }
+        assert (tmp_path / "out" / "model-v1.0.joblib").exists()
+
+    def test_run_workflow_unknown_class(self, tmp_path):
+        path = write_config(
+            tmp_path, "bad.yaml", tmp_path / "out", workflow_class="Unknown"
+        )
+
+        result = run_workflow(str(path))
+
+        assert result["status"] == "failed"
+        assert "Unknown workflow class" in result["error"]
+
+    def test_run_workflows(self, tmp_path):
+        config_dir = tmp_path / "configs"
+        config_dir.mkdir()
+        write_config(config_dir, "a.yaml", tmp_path / "a")
+        write_config(config_dir, "b.yaml", tmp_path / "b", model_version="2.0")
+        write_config(config_dir, "c.yaml", tmp_path / "c", workflow_class="Unknown")
+        summary_path = tmp_path / "summary.json"
+
+        summary = run_workflows(
+            str(config_dir), cpu_budget=2, summary_path=str(summary_path)
+        )
+
+        assert summary["max_workers"] == 2
+        assert summary["succeeded"] == 2
+        assert summary["failed"] == 1
+        assert [Path(w["config"]).name for w in summary["workflows"]] == [
+            "a.yaml",
+            "b.yaml",
+            "c.yaml",
+        ]
+        assert (tmp_path / "b" / "model-v2.0.joblib").exists()
+        assert json.loads(summary_path.read_text())["succeeded"] == 2
+
+    def test_run_workflows_shared_output_dir(self, tmp_path):
+        write_config(tmp_path, "a.yaml", tmp_path / "out")
+        write_config(tmp_path, "b.yaml", tmp_path / "out")
+
+        with pytest.raises(ValueError):
+            run_workflows(str(tmp_path))
+
+    @pytest.mark.parametrize("content", ["workflow_class: [unclosed", ""])
+    def test_run_workflows_unreadable_config(self, tmp_path, content):
+        config_dir = tmp_path / "configs"
+        config_dir.mkdir()
+        write_config(config_dir, "a.yaml", tmp_path / "a")
+        (config_dir / "bad.yaml").write_text(content)
+
+        summary = run_workflows(str(config_dir), cpu_budget=1)
+
+        assert summary["succeeded"] == 1
+        assert summary["failed"] == 1
+        bad = summary["workflows"][1]
+        assert Path(bad["config"]).name == "bad.yaml"
+        assert bad["status"] == "failed"
+        assert (tmp_path / "a" / "model-v1.0.joblib").exists()
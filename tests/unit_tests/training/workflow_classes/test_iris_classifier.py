@@ -3,9 +3,10 @@ import shutil
 import tempfile
 from pathlib import Path
 
+import numpy as np
 import pytest
 
-from src.training.workflow_classes.iris_classifier import IrisClassifier
+from src.training.workflow_classes.iris_classifier import IrisClassifier, bump_version
 
 
 @pytest.fixture
@@ -85,6 +86,13 @@ class TestIrisClassifier:
         assert "sklearn_version" in metadata
         assert "config" in metadata
 
+        reference = metadata["reference_distribution"]
+        assert set(reference["features"]) == set(iris_classifier.X_train.columns)
+        for feature in reference["features"].values():
+            assert len(feature["proportions"]) == len(feature["bin_edges"]) + 1
+            assert sum(feature["proportions"]) == pytest.approx(1)
+        assert sum(reference["class_proportions"].values()) == pytest.approx(1)
+
     def test_end_to_end_workflow(self, iris_classifier):
         iris_classifier.load_data()
         iris_classifier.split_data()
@@ -99,6 +107,104 @@ class TestIrisClassifier:
         assert model_path.exists()
         assert iris_classifier.accuracy > 0.5  # Expect some decent accuracy (>50%)
 
+    def test_incremental_without_previous_artifact(self, iris_classifier):
+        iris_classifier.config["incremental"] = True
+        iris_classifier.load_data()
+        iris_classifier.split_data()
+        iris_classifier.build_pipeline()
+        iris_classifier.train_model()
+
+        assert iris_classifier.warm_started_from is None
+        assert iris_classifier.config["model_version"] == "1.0"
+
+    def test_incremental_warm_start(self, config):
+        first = IrisClassifier(dict(config))
+        first.load_data()
+        first.split_data()
+        first.build_pipeline()
+        first.train_model()
+        first.save_model()
+        previous_preprocessor = first.pipeline.named_steps["preprocessor"]
+        previous_model = first.pipeline.named_steps["model"]
+
+        second = IrisClassifier(dict(config, incremental=True))
+        second.load_data()
+        second.split_data()
+        second.build_pipeline()
+        # The estimator starts from the coefficients of the saved model
+        model = second.pipeline.named_steps["model"]
+        np.testing.assert_array_equal(model.coef_, previous_model.coef_)
+        np.testing.assert_array_equal(model.intercept_, previous_model.intercept_)
+        second.train_model()
+        second.save_model()
+
+        assert second.warm_started_from == "1.0"
+        assert second.config["model_version"] == "1.1"
+        assert model.warm_start
+        # Starting from converged coefficients takes fewer solver iterations
+        assert model.n_iter_[0] < previous_model.n_iter_[0]
+        assert second.accuracy > 0.5
+
+        # The fitted preprocessing is reused as-is
+        sepal = second.pipeline.named_steps["preprocessor"].named_transformers_[
+            "sepal_branch"
+        ]
+        previous_sepal = previous_preprocessor.named_transformers_["sepal_branch"]
+        for new_edges, old_edges in zip(
+            sepal.named_steps["discretize"].bin_edges_,
+            previous_sepal.named_steps["discretize"].bin_edges_,
+        ):
+            assert (new_edges == old_edges).all()
+
+        out_dir = Path(config["output_dir"])
+        assert (out_dir / "model-v1.1.joblib").exists()
+        metadata = json.loads((out_dir / "metadata.json").read_text())
+        assert metadata["model_version"] == "1.1"
+        assert metadata["warm_started_from"] == "1.0"
+
+    def test_incremental_with_changed_preprocessing(self, config):
+        first = IrisClassifier(dict(config))
+        first.load_data()
+        first.split_data()
+        first.build_pipeline()
+        first.train_model()
+        first.save_model()
+
+        second = IrisClassifier(dict(config, incremental=True, sepal_bins=4))
+        second.load_data()
+        second.split_data()
+        second.build_pipeline()
+        second.train_model()
+
+        assert second.warm_started_from is None
+        assert second.config["model_version"] == "1.1"
+
+    def test_incremental_new_data_requires_x_new(self, config):
+        first = IrisClassifier(dict(config))
+        first.load_data()
+        first.split_data()
+        first.build_pipeline()
+        first.train_model()
+        first.save_model()
+
+        second = IrisClassifier(dict(config, incremental=True, incremental_data="new"))
+        second.load_data()
+        second.split_data()
+        second.build_pipeline()
+        with pytest.raises(ValueError):
+            second.train_model()
+
+    @pytest.mark.parametrize(
+        "version,expected", [("1.0.0", "1.0.1"), ("1.9", "1.10"), ("7", "8")]
+    )
+    def test_bump_version(self, version, expected):
+        assert bump_version(version) == expected
+
+    @pytest.mark.parametrize("version", ["1.0.0-rc1", "v1.0", "", "1..0"])
+    def test_bump_invalid_version(self, version):
+        with pytest.raises(ValueError, match="Cannot bump model version"):
+            bump_version(version)
+
     @pytest.fixture(autouse=True)
     def cleanup(self, request, config):
         """Cleanup output_dir after each test class finishes."""